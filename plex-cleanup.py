@@ -1,10 +1,12 @@
 # region Imports
+import atexit
 import math
 from datetime import datetime
 import json
 import logging
+import logging.handlers
+import queue
 import os.path
-import re
 import time
 
 from ast import literal_eval
@@ -12,24 +14,35 @@ import schedule
 import urllib3
 import sys
 from enum import Enum
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from os.path import exists
 
 from argparse import ArgumentParser
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
-from plexapi.server import PlexServer, Collection, Library
+from plexapi.server import PlexServer
+from plexapi.library import LibrarySection
 from plexapi.video import Movie
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # endregion
 # region Classes
 
 
-@dataclass
 class BaseClass:
+    __slots__ = ()
+
     def to_dict(self):
-        return asdict(self)
+        return {class_field.name: getattr(self, class_field.name) for class_field in fields(self)}
 
 
 class ConfigType(Enum):
@@ -43,9 +56,10 @@ class ScriptArgs:
     interval: int = 300
     config_type: ConfigType = ConfigType.FILE
     log_to_terminal: bool = False
+    since_last_run: bool = False
 
 
-@dataclass(init=True, repr=True)
+@dataclass(init=True, repr=True, frozen=True, slots=True)
 class ScriptSettings(BaseClass):
     plex_url: str
     api_key: str
@@ -62,40 +76,73 @@ class ScriptSettings(BaseClass):
         if len(self.api_key) < 1:
             raise ValueError('API provided is empty, please provide a valid plex API key')
 
+        # Repeated library names would walk the same library more than once, names are compared the same way libraries are looked up
+        unique_libraries: dict[str, str] = {}
+        for library_name in self.movie_libraries:
+            unique_libraries.setdefault(_normalize_library_name(library_name), library_name)
+        object.__setattr__(self, 'movie_libraries', list(unique_libraries.values()))
+
+
+@dataclass(init=True, repr=True)
+class CollectionRef(BaseClass):
+    rating_key: int
+    title: str
+    child_count: int
+    library_name: str
+
 
 # endregion
 # region Globals
 
 
 FILE_ENCODING = 'utf-8'
+SCRIPT_NAME = os.path.splitext(os.path.basename(os.path.abspath(__file__)))[0]
+PATH_CONFIG_FILE = f"{SCRIPT_NAME}.json"
+PATH_LOG_FILE = f"{SCRIPT_NAME}.log"
+PATH_CACHE_FILE = f"{SCRIPT_NAME}-cache.json"
+DEFAULT_PLEX_URL = 'https://plex-ip-or-hostname:32400/'
+DEFAULT_API_KEY = '<insert_api_key_here>'
+LOGGING_DEBUG = os.environ.get("LOGGING_DEBUG", None) is not None or exists('./debug')
+MAX_WORKER_THREADS = 8
+HTTP_POOL_SIZE = 32
+HTTP_REQUEST_TIMEOUT = (5, 30)  # Seconds to wait for a connection, then for a response
+PLEX_CONTAINER_SIZE = 500
 SETTINGS: ScriptSettings
 
 PLEX_INSTANCE: PlexServer
+PLEX_SESSION: requests.Session | None = None
+LIBRARY_SECTIONS: dict[str, LibrarySection] = {}
 
 
 # endregion
 # region Script Control
 
 
-def _get_running_script_name() -> str:
-    script_path = os.path.abspath(__file__)
-    return str(os.path.basename(script_path)).replace('.py', '')
-
-
 def _configure_logging(log_to_terminal: bool = False) -> None:
     """ Configure the application logger """
-    path_log_file = f"{_get_running_script_name()}.log"
     loglevel = logging.INFO
 
-    if exists('./debug') or os.environ.get("LOGGING_DEBUG", None) is not None:
+    if LOGGING_DEBUG:
         loglevel = logging.DEBUG
 
     if log_to_terminal:
-        log_handlers = [logging.StreamHandler(), logging.FileHandler(path_log_file)]
+        log_handlers = [logging.StreamHandler(), logging.FileHandler(PATH_LOG_FILE, encoding=FILE_ENCODING)]
     else:
-        log_handlers = [logging.FileHandler(path_log_file)]
+        log_handlers = [logging.FileHandler(PATH_LOG_FILE, encoding=FILE_ENCODING)]
+
+    log_formatter = logging.Formatter('%(asctime)s::%(levelname)s:%(message)s')
+    for log_handler in log_handlers:
+        log_handler.setFormatter(log_formatter)
 
-    logging.basicConfig(encoding=FILE_ENCODING, level=loglevel, format='%(asctime)s::%(levelname)s:%(message)s', handlers=log_handlers)
+    # Records are handed to a background listener so logging calls never block on file or terminal writes
+    log_queue = queue.Queue(-1)
+    log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(loglevel)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     logging.info('Logger initialized!')
 
 
@@ -121,64 +168,76 @@ def _error_occurred(message: str, exception: Exception = None) -> None:
         logging.error(message)
 
 
+def _serialize_json(content: dict) -> bytes:
+    """ Serialize the provided content to indented json bytes, uses orjson when available """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+
+    return json.dumps(content, indent=2, default=str).encode(FILE_ENCODING)
+
+
+def _deserialize_json(content: bytes) -> dict:
+    """ Deserialize the provided json content, uses orjson when available """
+    if orjson is not None:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
 def _create_config_file() -> None:
     """ Creates a default config file for modification """
-    path_config_file = f"{_get_running_script_name()}.json"
-
     try:
-        if exists(path_config_file):
-            os.remove(path_config_file)
-            logging.info(f"Deleted existing config file: {path_config_file}")
-
-        logging.debug(f"Attempting to create default config file at: {os.path.abspath(path_config_file)}")
+        logging.debug(f"Attempting to create default config file at: {os.path.abspath(PATH_CONFIG_FILE)}")
 
-        with open(path_config_file, 'w', encoding=FILE_ENCODING) as config_writer:
-            json.dump(
-                ScriptSettings('https://plex-ip-or-hostname:32400/', '<insert_api_key_here>').to_dict(), config_writer, indent=4, default=str)
+        # Opening for writing truncates any existing config file
+        with open(PATH_CONFIG_FILE, 'wb') as config_writer:
+            config_writer.write(_serialize_json(ScriptSettings(DEFAULT_PLEX_URL, DEFAULT_API_KEY).to_dict()))
 
-        logging.debug(f"Created default config file at: {os.path.abspath(path_config_file)}")
+        logging.debug(f"Created default config file at: {os.path.abspath(PATH_CONFIG_FILE)}")
     except Exception as ex:
         _stop_running_script(
-            f"Error occurred attempting to create config file at {os.path.abspath(path_config_file)}", ex)
+            f"Error occurred attempting to create config file at {os.path.abspath(PATH_CONFIG_FILE)}", ex)
 
 
 def _load_config_file() -> None:
-    """ Loads the script config file """
-    path_config_file = f"{_get_running_script_name()}.json"
-
-    logging.debug(f"Attempting to read config file: {path_config_file}")
+    """ Loads the script config file, a default config file is created and loaded if one doesn't exist """
+    global SETTINGS
+    logging.debug(f"Attempting to read config file: {PATH_CONFIG_FILE}")
     try:
-        if exists(path_config_file):
-            logging.info(f"Config file exists at {path_config_file}")
-        else:
+        try:
+            with open(PATH_CONFIG_FILE, 'rb') as config_reader:
+                loaded_config = _deserialize_json(config_reader.read())
+        except FileNotFoundError:
             _create_config_file()
-            return_message = f"Config file wasn't found, created a new one at: {os.path.abspath(path_config_file)}"
+            return_message = f"Config file wasn't found, created a new one at: {os.path.abspath(PATH_CONFIG_FILE)}"
             logging.info(return_message)
-            exit(0)
-        with open(path_config_file, 'r', encoding=FILE_ENCODING) as config_reader:
-            loaded_config = json.load(config_reader)
-            global SETTINGS
-            SETTINGS = ScriptSettings(**loaded_config)
+
+            # The defaults we just wrote are already in memory, no need to read them back from disk
+            SETTINGS = ScriptSettings(DEFAULT_PLEX_URL, DEFAULT_API_KEY)
+            return
+
+        logging.info(f"Config file exists at {PATH_CONFIG_FILE}")
+        SETTINGS = ScriptSettings(**loaded_config)
     except Exception as ex:
-        _stop_running_script(f"Failure occurred attempting to load the config file: {path_config_file}", ex)
+        _stop_running_script(f"Failure occurred attempting to load the config file: {PATH_CONFIG_FILE}", ex)
 
 
 def _load_environment_variables():
     """ Loads script configuration from environment variables """
     logging.debug("Attempting to read script configuration from environment variables")
-    global SETTINGS
-    SETTINGS = ScriptSettings('example.com', 'default_token')
+    environment_values = {'plex_url': 'example.com', 'api_key': 'default_token'}
 
-    for class_property in dir(SETTINGS):
-        if callable(getattr(SETTINGS, class_property)) or class_property.startswith('_'):
-            continue
-
-        environment_value = os.environ.get(class_property.upper(), None)
+    for settings_field in fields(ScriptSettings):
+        environment_value = os.environ.get(settings_field.name.upper(), None)
         if environment_value is None:
             continue
 
-        logging.debug(f"Setting script config from environment: {class_property} => {environment_value}")
-        setattr(SETTINGS, class_property, environment_value)
+        logging.debug(f"Setting script config from environment: {settings_field.name} => {environment_value}")
+        environment_values[settings_field.name] = environment_value
+
+    # Settings are immutable once created, so values are converted before building them
+    global SETTINGS
+    SETTINGS = ScriptSettings(**_convert_environment_variable_types(environment_values))
 
 
 def _script_startup(config_type: ConfigType, log_to_terminal: bool) -> None:
@@ -211,6 +270,8 @@ def _parse_script_arguments() -> ScriptArgs:
     parser.add_argument('-i', '--interval', type=int, default=300, help='Used in conjunction with -c, Interval in seconds between runs, default is 300')
     parser.add_argument('-e', '--environment', action='store_true', help='Execute with environment variables instead of config file')
     parser.add_argument('-lt', '--logterminal', action='store_true', help='Adds logging to terminal output as well as log file')
+    parser.add_argument('-s', '--sincelastrun', action='store_true',
+                        help='When not deleting collections, only report collections that are new or changed since the last run')
 
     parsed_args = parser.parse_args()
 
@@ -220,166 +281,395 @@ def _parse_script_arguments() -> ScriptArgs:
     converted_args.interval = getattr(parsed_args, 'interval', converted_args.interval)
     converted_args.config_type = ConfigType.ENVIRONMENT if bool(getattr(parsed_args, 'environment', False)) else ConfigType.FILE
     converted_args.log_to_terminal = getattr(parsed_args, 'logterminal', converted_args.log_to_terminal)
+    converted_args.since_last_run = getattr(parsed_args, 'sincelastrun', converted_args.since_last_run)
 
     return converted_args
 
 
+def _create_plex_session() -> requests.Session:
+    """ Create a keep-alive http session with a pooled adapter and retries for transient server errors """
+    session = requests.Session()
+    session.verify = False
+    session.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': 'gzip'})
+
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                          max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                                            allowed_methods=frozenset(['GET', 'PUT', 'DELETE']), raise_on_status=False))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    urllib3.disable_warnings()
+
+    return session
+
+
 def connect_to_plex_instance(plex_url: str, plex_key: str) -> None:
     """ Connect to the specified plex url and auth with the provided api key and return the instance object """
     try:
         logging.debug(f"Attempting to connect to plex instance at: {plex_url}")
 
-        session = requests.Session()
-        session.verify = False
-        urllib3.disable_warnings()
+        # Reuse the session between runs so continuous execution keeps its pooled connections
+        global PLEX_SESSION
+        if PLEX_SESSION is None:
+            PLEX_SESSION = _create_plex_session()
 
         global PLEX_INSTANCE
-        PLEX_INSTANCE = PlexServer(plex_url, plex_key, session=session)
+        PLEX_INSTANCE = PlexServer(plex_url, plex_key, session=PLEX_SESSION, timeout=HTTP_REQUEST_TIMEOUT)
+        LIBRARY_SECTIONS.clear()
 
         logging.info(f"Successfully connected to plex instance at: {plex_url}")
     except Exception as ex:
         _stop_running_script("Failure occurred attempting to connect to the provided plex url", ex)
 
 
-def get_movie_collections(movie_libraries: list[str], collection_size_minimum: int) -> list[Collection]:
-    """ Return all movie collections from the connected plex instance, filters collections based on the minimum collection size provided in the config file """
+def _normalize_library_name(library_name: str) -> str:
+    """ Return the provided library name in the form used to match library sections, plex matches names case-insensitively """
+    return library_name.lower().strip()
+
+
+def _refresh_library_sections() -> None:
+    """ Reload all library sections from the connected plex instance in a single request so section details are current """
+    LIBRARY_SECTIONS.clear()
+    for library_section in PLEX_INSTANCE.library.sections():
+        LIBRARY_SECTIONS[_normalize_library_name(library_section.title)] = library_section
+
+
+def _get_library_section(library_name: str) -> LibrarySection:
+    """ Return the library section with the provided name from the sections loaded for this run """
+    if not LIBRARY_SECTIONS:
+        _refresh_library_sections()
+
+    library_section = LIBRARY_SECTIONS.get(_normalize_library_name(library_name))
+    if library_section is None:
+        available_libraries = ', '.join(section.title for section in LIBRARY_SECTIONS.values())
+        raise ValueError(f"Library [{library_name}] wasn't found on the plex instance, available libraries: {available_libraries}")
+
+    return library_section
+
+
+def _is_valid_cached_library(cached_library) -> bool:
+    """ Return whether the provided collection cache entry matches the format written by this script """
+    if not isinstance(cached_library, dict) or set(cached_library) != {'updated_at', 'collections'}:
+        return False
+    if not isinstance(cached_library['collections'], list):
+        return False
+
+    collection_ref_fields = {collection_ref_field.name for collection_ref_field in fields(CollectionRef)}
+    return all(isinstance(cached_collection, dict) and set(cached_collection) == collection_ref_fields
+               for cached_collection in cached_library['collections'])
+
+
+def _load_collection_cache() -> dict:
+    """ Load the collection cache from the last run, returns an empty cache if there isn't a usable one """
+    try:
+        with open(PATH_CACHE_FILE, 'rb') as cache_reader:
+            loaded_cache = _deserialize_json(cache_reader.read())
+    except FileNotFoundError:
+        return {}
+    except Exception as ex:
+        _error_occurred(f"Failure occurred attempting to load the collection cache file, ignoring it: {PATH_CACHE_FILE}", ex)
+        return {}
+
+    if not isinstance(loaded_cache, dict):
+        _error_occurred(f"Collection cache file isn't in the expected format, ignoring it: {PATH_CACHE_FILE}")
+        return {}
+
+    # Libraries with entries we don't recognize are left out so they're listed fresh and rewritten this run
+    return {library_name: cached_library for library_name, cached_library in loaded_cache.items() if _is_valid_cached_library(cached_library)}
+
+
+def _save_collection_cache(collection_cache: dict) -> None:
+    """ Save the provided collection cache for the next run """
+    try:
+        with open(PATH_CACHE_FILE, 'wb') as cache_writer:
+            cache_writer.write(_serialize_json(collection_cache))
+    except Exception as ex:
+        _error_occurred(f"Failure occurred attempting to save the collection cache file: {PATH_CACHE_FILE}", ex)
+
+
+def _fetch_collections(movie_library: str, cached_library: dict | None) -> tuple[str | None, list[CollectionRef], bool]:
+    """ Return when the provided movie library was last updated, its collections and whether they came from the cache of an unchanged library """
+    library_section = _get_library_section(movie_library)
+    library_updated_at = library_section.updatedAt.isoformat() if library_section.updatedAt else None
+
+    if library_updated_at is not None and cached_library is not None and cached_library.get('updated_at') == library_updated_at:
+        collections = [CollectionRef(**cached_collection) for cached_collection in cached_library['collections']]
+        logging.info(f"Library [{movie_library}] is unchanged since the last run, using cached collection count of [{len(collections)}]")
+        return library_updated_at, collections, True
+
+    logging.debug(f"Attempting to load collections from movie library: {movie_library}")
+
+    # Only attributes included in the collection listing are read here, touching children or items would reload every collection
+    collections = [CollectionRef(collection.ratingKey, collection.title, collection.childCount, movie_library)
+                   for collection in library_section.collections(container_size=PLEX_CONTAINER_SIZE)]
+    logging.info(f"Library [{movie_library}] has a collection count of [{len(collections)}]")
+
+    return library_updated_at, collections, False
+
+
+def get_movie_collections(movie_libraries: list[str], collection_size_minimum: int, only_changed_since_last_run: bool = False,
+                          use_collection_cache: bool = True) -> list[CollectionRef]:
+    """ Return all movie collections from the connected plex instance, filters collections based on the minimum collection size provided in the config file,
+        optionally only returning collections that are new or changed since the last run, cached collections are only used when allowed """
     collection_count_total = 0
-    collection_filtered_list: list[Collection] = []
-    collection_size_min = int(collection_size_minimum)
-    for movie_library in movie_libraries:
-        try:
-            logging.debug(f"Attempting to load collections from movie library: {movie_library}")
+    collection_count_reported = 0
+    collection_filtered_list: list[CollectionRef] = []
+    debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
 
-            collections = PLEX_INSTANCE.library.section(movie_library).search(libtype='collection')
-            logging.info(f"Library [{movie_library}] has a collection count of [{len(collections)}]")
+    collection_cache = _load_collection_cache()
 
-            logging.debug(f"Successfully grabbed movie library [{movie_library}], attempting to enumerate [{len(collections)}] collections")
+    # Library searches are independent network round-trips, so we'll run them concurrently and filter each as it completes
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKER_THREADS, len(movie_libraries)))) as executor:
+        collection_futures = {executor.submit(_fetch_collections, movie_library, collection_cache.get(movie_library) if use_collection_cache else None): movie_library
+                              for movie_library in movie_libraries}
 
-            for collection in collections:
-                logging.debug(f"Enumerating collection, validating size: [collection_name]{collection.title}"
-                              f" [collection_members]{collection.childCount} [member_minimum]{collection_size_min}")
+        for collection_future in as_completed(collection_futures):
+            movie_library = collection_futures[collection_future]
+            try:
+                library_updated_at, collections, library_unchanged = collection_future.result()
+            except Exception as ex:
+                _error_occurred(f"Failure occurred attempting to parse movie library: {movie_library}", ex)
+                continue
 
-                collection_count_total += 1
+            cached_library = collection_cache.get(movie_library)
+            collection_cache[movie_library] = {'updated_at': library_updated_at, 'collections': [collection.to_dict() for collection in collections]}
+            collection_count_total += len(collections)
 
-                if collection_size_min > -1 and collection.childCount < collection_size_min:
-                    logging.debug(f"Found movie collection matching provided criteria, appending to master list: {collection.title}")
-                    collection_filtered_list.append(collection)
-        except Exception as ex:
-            _error_occurred("Failure occurred attempting to parse movie library", ex)
+            if only_changed_since_last_run:
+                if library_unchanged:
+                    logging.info(f"No changes since last run for library [{movie_library}], skipping")
+                    continue
+
+                # Only collections that weren't in the last run with the same size are reported
+                previous_collections = {(cached_collection.get('rating_key'), cached_collection.get('child_count'))
+                                        for cached_collection in cached_library.get('collections', [])} if cached_library else set()
+                collections = [collection for collection in collections if (collection.rating_key, collection.child_count) not in previous_collections]
+
+            collection_count_reported += len(collections)
+            logging.debug("Successfully grabbed movie library [%s], attempting to enumerate [%s] collections", movie_library, len(collections))
+
+            if debug_enabled:
+                for collection in collections:
+                    logging.debug("Enumerating collection, validating size: [collection_name]%s [collection_members]%s [member_minimum]%s",
+                                  collection.title, collection.child_count, collection_size_minimum)
+
+            # A negative minimum disables collection size cleanup
+            if collection_size_minimum < 0:
+                continue
+
+            undersized_collections = [collection for collection in collections if collection.child_count < collection_size_minimum]
+            if debug_enabled:
+                for collection in undersized_collections:
+                    logging.debug("Found movie collection matching provided criteria, appending to master list: %s", collection.title)
+
+            collection_filtered_list.extend(undersized_collections)
+
+    _save_collection_cache(collection_cache)
 
     logging.info(f"Total collections found to be removed: {len(collection_filtered_list)}")
     logging.info(f"Total collection count enumerated: {collection_count_total} from {len(movie_libraries)} libraries")
+    if only_changed_since_last_run:
+        logging.info(f"Total collections new or changed since the last run: {collection_count_reported}")
     return collection_filtered_list
 
 
-def _delete_movie_collection(collection: Collection) -> None:
+def _delete_movie_collection(collection: CollectionRef) -> None:
     """ Delete the provided movie collection from the connected plex instance """
     try:
         collection_name = collection.title
-        logging.debug(f"Attempting to delete moving collection: {collection_name}")
-        collection.delete()
+        logging.debug("Attempting to delete moving collection: %s", collection_name)
+        # Delete by rating key directly rather than fetching the full collection object first
+        PLEX_INSTANCE.query(f"/library/collections/{collection.rating_key}", method=PLEX_SESSION.delete)
         logging.info(f"Deleted movie collection: {collection_name}")
     except Exception as ex:
         _error_occurred(f"Failure occurred attempting to delete the provided collection: {collection.title}", ex)
 
 
-def take_action_on_movie_collections(collections: list[Collection], delete_undersized_collections: bool = False) -> None:
+def _forget_cached_libraries(library_names: set[str]) -> None:
+    """ Remove the provided libraries from the collection cache so they're fully walked on the next run """
+    collection_cache = _load_collection_cache()
+    for library_name in library_names:
+        collection_cache.pop(library_name, None)
+
+    _save_collection_cache(collection_cache)
+
+
+def take_action_on_movie_collections(collections: list[CollectionRef], delete_undersized_collections: bool = False) -> None:
     """ Deletes or conveys the provided movie collections list """
-    for collection in collections:
-        if delete_undersized_collections:
-            _delete_movie_collection(collection)
-        else:
+    if not delete_undersized_collections:
+        for collection in collections:
             logging.info(f"We would delete this undersized movie collection: {collection.title}")
+        return
+
+    if not collections:
+        return
+
+    # Deletes are independent requests to plex, so we'll send them concurrently over the pooled session
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKER_THREADS, len(collections))) as executor:
+        delete_futures = [executor.submit(_delete_movie_collection, collection) for collection in collections]
+        for delete_future in as_completed(delete_futures):
+            delete_future.result()
+
+    # Cached collection lists for these libraries no longer match the server
+    _forget_cached_libraries({collection.library_name for collection in collections})
+
 
+def _fetch_movie_page(movie_library: LibrarySection, container_start: int) -> list[Movie]:
+    """ Return a single page of movies from the provided library section starting at the provided offset """
+    # Library listings already include media parts, so file paths are available without reloading each movie
+    return movie_library.search(libtype='movie', container_start=container_start, container_size=PLEX_CONTAINER_SIZE, maxresults=PLEX_CONTAINER_SIZE)
 
-def get_all_movies(movie_libraries: list[str]) -> list[Movie]:
-    all_movies = []
+
+def _iter_library_movies(library: str) -> Iterator[Movie]:
+    """ Yield all movies from the provided movie library, the next page is fetched while the current page is being processed """
+    movie_library = _get_library_section(library)
+
+    with ThreadPoolExecutor(max_workers=1) as page_fetcher:
+        container_start = 0
+        next_page = page_fetcher.submit(_fetch_movie_page, movie_library, container_start)
+
+        while next_page is not None:
+            library_movies = next_page.result()
+            container_start += len(library_movies)
+
+            # A short page means we've reached the end of the library
+            if len(library_movies) == PLEX_CONTAINER_SIZE:
+                next_page = page_fetcher.submit(_fetch_movie_page, movie_library, container_start)
+            else:
+                next_page = None
+
+            yield from library_movies
+
+
+def get_all_movies(movie_libraries: list[str]) -> Iterator[Movie]:
+    movie_count_total = 0
 
     for library in movie_libraries:
+        library_movie_count = 0
         try:
-            movie_library: Library = PLEX_INSTANCE.library.section(library)
-            library_movies: list[Movie] = movie_library.search(libtype='movie')
-
-            all_movies.extend(library_movies)
-            logging.debug(f"Gathered {len(library_movies)} movies from the {library} library")
+            for movie in _iter_library_movies(library):
+                library_movie_count += 1
+                yield movie
         except Exception as ex:
             logging.error(f"Error occurred attempting to parse {library} movies: {ex}")
 
-    logging.info(f"Found a total of {len(all_movies)} movies from targeted libraries")
-    return all_movies
+        logging.debug(f"Gathered {library_movie_count} movies from the {library} library")
+        movie_count_total += library_movie_count
+
+    logging.info(f"Found a total of {movie_count_total} movies from targeted libraries")
+
+
+def _rename_movie(movie: Movie, movie_name: str) -> bool:
+    """ Update the title and sort title of the provided movie, returns whether the update was successful """
+    try:
+        movie_title = movie.title
+        movie.edit(**{"title.value": movie_name, "titleSort.value": movie_name})
+        logging.info(f"Updated Movie Title & Sort Title: {movie_title} => {movie_name}")
+        return True
+    except Exception as ex:
+        _error_occurred(f"Failure occurred attempting to update the provided movie title: {movie.title}", ex)
+        return False
 
 
-def _sanitize_movie_name_for_file_match(movie_title: str, sanitize_pattern: str):
-    return re.sub(sanitize_pattern, "", movie_title).strip()
+def _sanitize_movie_name_for_file_match(movie_title: str, sanitize_table: dict[int, None]) -> str:
+    # No skip characters configured means there's nothing to translate, only whitespace to trim
+    if not sanitize_table:
+        return movie_title.strip()
 
+    return movie_title.translate(sanitize_table).strip()
 
-def ensure_movie_name_matches_file(movies: list[Movie], make_changes: bool, characters_to_skip_for_match: list[str]) -> None:
+
+def ensure_movie_name_matches_file(movies: Iterable[Movie], make_changes: bool, characters_to_skip_for_match: list[str], names_to_exclude: list[str]) -> None:
     logging.debug("Starting movie file and name match enforcement")
     fixed_movie_count = 0
-    movie_title_sanitize_pattern = "|".join(map(re.escape, characters_to_skip_for_match))
+    # Skip characters are only ever deleted, a translation table does that in a single pass without regex overhead
+    movie_title_sanitize_table = str.maketrans('', '', ''.join(characters_to_skip_for_match))
+    movie_names_exclude = tuple(names_to_exclude)
+    movies_to_rename: list[tuple[Movie, str]] = []
 
     for movie in movies:
         # Verify provided exclude filters, if any are inside teh title of the movie we'll skip it
-        if any(exclude_name in movie.title for exclude_name in SETTINGS.enforce_movie_names_exclude):
-            logging.debug(f"Skipping matching movie in provided exclude list: {movie.title}")
+        if movie_names_exclude and any(exclude_name in movie.title for exclude_name in movie_names_exclude):
+            logging.debug("Skipping matching movie in provided exclude list: %s", movie.title)
             continue
 
-        # Get the file name and discard the file extension of the movie
-        file_name, _ = os.path.splitext(os.path.basename(movie.media[0].parts[0].file))
+        # Get the file name and discard the file extension of the movie, plex can report either path separator
+        file_base_name = movie.media[0].parts[0].file.rpartition('/')[2].rpartition('\\')[2]
+        file_name = file_base_name.rpartition('.')[0] or file_base_name
 
         # Extract and trim movie name | Movies have the year in the name following this format: movie name (movie_year).extension
-        file_movie_name = str(file_name).split('(')[0].strip()
+        file_movie_name = file_name.partition('(')[0].strip()
 
-        logging.debug(f"Movie: {movie.title} | File: {file_movie_name}")
-        sanitized_title_name = _sanitize_movie_name_for_file_match(movie.title, movie_title_sanitize_pattern)
-        sanitized_file_name = _sanitize_movie_name_for_file_match(file_movie_name, movie_title_sanitize_pattern)
+        logging.debug("Movie: %s | File: %s", movie.title, file_movie_name)
+        sanitized_title_name = _sanitize_movie_name_for_file_match(movie.title, movie_title_sanitize_table)
+        sanitized_file_name = _sanitize_movie_name_for_file_match(file_movie_name, movie_title_sanitize_table)
 
         # Sanitized movie and file names match, so we'll move on
         if sanitized_title_name == sanitized_file_name:
             continue
 
-        logging.debug(f"Sanitized movie name doesn't match file name: {movie.title} != {file_movie_name}")
+        logging.debug("Sanitized movie name doesn't match file name: %s != %s", movie.title, file_movie_name)
 
         if make_changes:
-            movie.edit(**{"title.value": sanitized_file_name, "titleSort.value": sanitized_file_name})
-            fixed_movie_count += 1
-            logging.info(f"Updated Movie Title & Sort Title: {movie.title} => {sanitized_file_name}")
+            movies_to_rename.append((movie, sanitized_file_name))
+
+    # Each rename is its own request to plex, so we'll send them concurrently over the pooled session
+    if movies_to_rename:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKER_THREADS, len(movies_to_rename))) as executor:
+            rename_futures = [executor.submit(_rename_movie, movie, movie_name) for movie, movie_name in movies_to_rename]
+            fixed_movie_count = sum(1 for rename_future in as_completed(rename_futures) if rename_future.result())
 
     logging.info(f"Finished movie name enforcement, fixed {fixed_movie_count} movies")
 
 
-def _convert_environment_variable_types() -> None:
+def _convert_environment_variable_types(environment_values: dict[str, str]) -> dict:
     """ Converts the provided environment variable values to their respective values """
     logging.debug("Attempting to convert environment variables to their respective types")
 
-    SETTINGS.movie_libraries = literal_eval(str(SETTINGS.movie_libraries))
-    SETTINGS.movie_name_enforce_skip_characters = literal_eval(str(SETTINGS.movie_name_enforce_skip_characters))
-    SETTINGS.enforce_movie_names_exclude = literal_eval(str(SETTINGS.enforce_movie_names_exclude))
+    converted_values = dict(environment_values)
+    for list_setting in ('movie_libraries', 'movie_name_enforce_skip_characters', 'enforce_movie_names_exclude'):
+        if list_setting in converted_values:
+            converted_values[list_setting] = literal_eval(converted_values[list_setting])
+    if 'collection_size_minimum' in converted_values:
+        converted_values['collection_size_minimum'] = int(converted_values['collection_size_minimum'])
 
     logging.debug("Finished converting environment variables to their respective types")
+    return converted_values
 
 
 # endregion
 # region Script Execution
 
 
-def main():
-    """ Main script execution point """
-
-    connect_to_plex_instance(SETTINGS.plex_url, SETTINGS.api_key)
+def run_cleanup(script_args: ScriptArgs):
+    """ Run a single round of cleanup work against the connected plex instance """
+    # Section details are cached with the connection, refresh them so we can tell which libraries changed since the last run
+    _refresh_library_sections()
 
-    movie_collections = get_movie_collections(SETTINGS.movie_libraries, SETTINGS.collection_size_minimum)
+    # Collections left undeleted last run still need deleting, so only dry runs can skip what hasn't changed
+    only_changed_since_last_run = script_args.since_last_run and not SETTINGS.delete_undersized_collections
+    # Collection sizes can change without the library's updatedAt moving, so cached sizes are only used when opted into with since last run
+    use_collection_cache = only_changed_since_last_run
+    movie_collections = get_movie_collections(SETTINGS.movie_libraries, SETTINGS.collection_size_minimum, only_changed_since_last_run, use_collection_cache)
     take_action_on_movie_collections(movie_collections, SETTINGS.delete_undersized_collections)
 
     all_movies = get_all_movies(SETTINGS.movie_libraries)
-    ensure_movie_name_matches_file(all_movies, SETTINGS.enforce_movie_names_match_file_names, SETTINGS.movie_name_enforce_skip_characters)
+    ensure_movie_name_matches_file(all_movies, SETTINGS.enforce_movie_names_match_file_names, SETTINGS.movie_name_enforce_skip_characters,
+                                   SETTINGS.enforce_movie_names_exclude)
     logging.info("Finished a round of plex cleanup work")
 
 
+def main(script_args: ScriptArgs):
+    """ Main script execution point """
+    connect_to_plex_instance(SETTINGS.plex_url, SETTINGS.api_key)
+    run_cleanup(script_args)
+
+
 def main_continuous(script_args: ScriptArgs):
     """ Main script execution point for continuous execution """
-    main()
-    schedule.every(script_args.interval).seconds.do(lambda: main())
+    # Connect once so every scheduled run reuses the same plex instance and pooled session
+    connect_to_plex_instance(SETTINGS.plex_url, SETTINGS.api_key)
+    run_cleanup(script_args)
+    schedule.every(script_args.interval).seconds.do(run_cleanup, script_args)
 
     while True:
         schedule.run_pending()
@@ -401,13 +691,15 @@ if __name__ == '__main__':
 
     try:
         _script_startup(script_arguments.config_type, script_arguments.log_to_terminal)
-        if script_arguments.config_type == ConfigType.ENVIRONMENT:
-            _convert_environment_variable_types()
+
+        if SETTINGS.api_key == DEFAULT_API_KEY:
+            logging.info(f"Config still has the default placeholder values, please fill out {os.path.abspath(PATH_CONFIG_FILE)} and run the script again")
+            _script_exit()
 
         if bool(script_arguments.continuous):
             main_continuous(script_arguments)
         else:
-            main()
+            main(script_arguments)
             _script_exit()
     except Exception as root_exception:
         _stop_running_script("Global script failure occurred", root_exception, 1)